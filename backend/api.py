@@ -9,6 +9,7 @@ import asyncio
 import uvicorn
 import logging
 import json
+import orjson
 import os
 import sys
 from typing import Optional, List, Dict, Any, Callable, Awaitable, Union
@@ -121,6 +122,12 @@ os.makedirs(audio_dir, exist_ok=True)
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 logger.info(f"Static files mounted from: {static_dir}")
 
+@app.on_event("shutdown")
+async def close_http_sessions():
+    """Close pooled HTTP sessions shared by the generation pipeline."""
+    from backend.services.services import close_scrape_session
+    await close_scrape_session()
+
 # Create the database tables if they don't exist
 # We'll use alembic for proper migrations in production
 @app.on_event("startup")
@@ -396,12 +403,13 @@ class ImportPathRequest(BaseModel):
 active_generations: Dict[str, Dict[str, Any]] = {} # Added type hint for clarity
 active_generations_lock = asyncio.Lock()
 
-# Custom class for handling datetime object serialization
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload as a Server-Sent Events data frame.
+
+    orjson emits bytes directly and handles datetime objects natively, which
+    keeps serialization of large preview payloads cheap on the event loop.
+    """
+    return b"data: " + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
 
 # --- Helper Function to Get Redis Client ---
 async def get_redis_client():
@@ -1302,7 +1310,7 @@ async def learning_path_progress_stream(task_id: str, request: Request):
                     if not task_info:
                         # Task not found or already cleaned up
                         logger.warning(f"SSE stream request for unknown or completed task {task_id}.")
-                        yield f"data: {json.dumps({'error': 'Task not found or completed.', 'status': 'unknown'})}" + "\n\n"
+                        yield _sse_event({'error': 'Task not found or completed.', 'status': 'unknown'})
                         break
                     
                     progress_items = task_info.get("progress_stream", [])
@@ -1314,7 +1322,7 @@ async def learning_path_progress_stream(task_id: str, request: Request):
                         message_to_send = progress_items[i]
                         # Ensure message_to_send is a dict (it should be from model_dump())
                         if isinstance(message_to_send, dict):
-                            yield f"data: {json.dumps(message_to_send, cls=DateTimeEncoder)}" + "\n\n"
+                            yield _sse_event(message_to_send)
                         else:
                             logger.warning(f"Skipping non-dict progress item for task {task_id}: {type(message_to_send)}")
                     last_sent_index = len(progress_items)
@@ -1329,7 +1337,7 @@ async def learning_path_progress_stream(task_id: str, request: Request):
                         "action": "stream_close",
                         "status": current_status
                     }
-                    yield f"data: {json.dumps(final_message)}" + "\n\n"
+                    yield _sse_event(final_message)
                     break
                 
                 await asyncio.sleep(0.5)  # Poll for new messages periodically
@@ -1339,7 +1347,7 @@ async def learning_path_progress_stream(task_id: str, request: Request):
             logger.exception(f"Error in SSE stream for task {task_id}: {e}")
             try:
                 error_payload = {"error": "Stream error", "detail": str(e), "status": "error"}
-                yield f"data: {json.dumps(error_payload)}" + "\n\n"
+                yield _sse_event(error_payload)
             except Exception: # Guard against errors during error reporting itself
                 pass # Avoid further exceptions in the error handling path
         finally:
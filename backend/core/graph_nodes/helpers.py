@@ -4,6 +4,8 @@ import logging
 import re
 import time
 import json
+import random
+import weakref
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import BaseOutputParser, StrOutputParser
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -12,6 +14,17 @@ logger = logging.getLogger("learning_path.helpers")
 
 # --- Constants ---
 MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT = 100000
+# Translation table used to double curly braces in a single pass
+_BRACE_TABLE = str.maketrans({"{": "{{", "}": "}}"})
+# Upper bound in seconds for a single backoff wait between LLM API retries
+MAX_RETRY_DELAY = 20.0
+# Standalone HTTP status codes identifying transient provider errors (429 and 5xx)
+TRANSIENT_STATUS_PATTERN = re.compile(r"\b(429|5\d\d)\b")
+# Substrings identifying transient provider errors (rate limits, overloaded/unavailable backends)
+TRANSIENT_ERROR_MARKERS = (
+    "resource exhausted", "resourceexhausted", "rate limit", "too many requests",
+    "overloaded", "unavailable", "timed out", "timeout",
+)
 # --- End Constants ---
 
 T = TypeVar('T')  # Type variable for parser return type
@@ -30,8 +43,8 @@ def escape_curly_braces(text: str) -> str:
     if not isinstance(text, str):
         return str(text)
     
-    # Duplicar todas las llaves para escaparlas
-    return text.replace('{', '{{').replace('}', '}}')
+    # Duplicar todas las llaves para escaparlas (una sola pasada con translate)
+    return text.translate(_BRACE_TABLE)
 
 def extract_json_from_markdown(text: str) -> Optional[Dict[str, Any]]:
     """
@@ -74,6 +87,85 @@ def extract_json_from_markdown(text: str) -> Optional[Dict[str, Any]]:
     # If we couldn't extract JSON, return None
     return None
 
+# Rendered format instructions, keyed by the parser's pydantic model. Weak keys let
+# classes defined at runtime be collected instead of being pinned by the cache.
+_format_instructions_cache: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+def get_format_instructions(parser: BaseOutputParser) -> str:
+    """
+    Returns the parser's format instructions, rendering each schema only once.
+    
+    Pydantic output parsers rebuild the full JSON schema text on every
+    get_format_instructions() call, although it never changes at runtime.
+    
+    Args:
+        parser: An output parser instance (e.g., a PydanticOutputParser).
+        
+    Returns:
+        The format instructions string.
+    """
+    cache_key = getattr(parser, "pydantic_object", None)
+    if cache_key is None:
+        return parser.get_format_instructions()
+    instructions = _format_instructions_cache.get(cache_key)
+    if instructions is None:
+        instructions = parser.get_format_instructions()
+        _format_instructions_cache[cache_key] = instructions
+    return instructions
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Checks whether an exception looks like a transient provider failure worth retrying.
+    
+    Args:
+        error: The exception raised by the LLM call.
+        
+    Returns:
+        True for rate limits (429), server-side errors (5xx), timeouts and similar.
+    """
+    # Timeout exceptions usually carry an empty message, so check the type itself
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status_code = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status_code, int) and (status_code == 429 or 500 <= status_code < 600):
+        return True
+    if isinstance(status_code, int):
+        return False
+    # Include the exception type so e.g. httpx.ReadTimeout("") still matches "timeout"
+    error_str = f"{type(error).__name__}: {error}".lower()
+    if TRANSIENT_STATUS_PATTERN.search(error_str):
+        return True
+    return any(marker in error_str for marker in TRANSIENT_ERROR_MARKERS)
+
+def get_retry_delay(error: Optional[Exception], attempt: int, initial_delay: float = 1.0,
+                    max_delay: float = MAX_RETRY_DELAY) -> float:
+    """
+    Computes how long to wait before the next retry.
+    
+    Honors a Retry-After header when the error carries an HTTP response, otherwise uses
+    exponential backoff with full jitter so concurrent callers don't retry in lockstep.
+    
+    Args:
+        error: The exception that triggered the retry (may be None).
+        attempt: The retry attempt number, starting at 1.
+        initial_delay: Base delay in seconds for the first retry.
+        max_delay: Maximum delay in seconds.
+        
+    Returns:
+        The delay in seconds.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(max_delay, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass
+    backoff = min(max_delay, initial_delay * (2 ** (attempt - 1)))
+    return random.uniform(0.0, backoff)
+
 def batch_items(items: List[Any], batch_size: int) -> List[List[Any]]:
     """
     Splits a list of items into batches of a specified size.
@@ -199,7 +291,7 @@ async def run_chain(prompt, llm_getter, parser: BaseOutputParser[T], params: Dic
                 try:
                     format_instructions = escaped_params.get("format_instructions", "")
                     if not format_instructions and hasattr(parser, "get_format_instructions"):
-                        format_instructions = parser.get_format_instructions()
+                        format_instructions = get_format_instructions(parser)
                     
                     # Create specialized retry prompt
                     retry_prompt = create_retry_prompt(prompt, format_instructions, last_raw_response, f"JSON parsing failed on attempt {parsing_retries}")
@@ -339,15 +431,17 @@ async def run_chain(prompt, llm_getter, parser: BaseOutputParser[T], params: Dic
                 await asyncio.sleep(parsing_retry_delay)
                 continue
             
-            # Handle API call errors
-            if is_gemini and api_retries < max_retries and ("api" in error_str.lower() or "400" in error_str):
+            # Handle API call errors, including rate limits and transient server errors from any LLM
+            is_gemini_api_error = is_gemini and ("api" in error_str.lower() or "400" in error_str)
+            is_transient = not is_parsing_error and is_transient_error(e)
+            if api_retries < max_retries and (is_gemini_api_error or is_transient):
                 if not api_retry_start_time:
                     api_retry_start_time = time.time()
                 
                 api_retries += 1
-                retry_delay = initial_retry_delay * (2 ** (api_retries - 1))
+                retry_delay = get_retry_delay(e, api_retries, initial_retry_delay)
                 
-                logger.warning(f"Gemini API error: {error_str}. Retry attempt {api_retries}/{max_retries} after {retry_delay:.2f}s delay")
+                logger.warning(f"LLM API error: {error_str}. Retry attempt {api_retries}/{max_retries} after {retry_delay:.2f}s delay")
                 await asyncio.sleep(retry_delay)
                 continue
             
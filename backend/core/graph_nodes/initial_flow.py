@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from langchain_core.messages import HumanMessage
 import os
 
@@ -10,40 +10,29 @@ from backend.parsers.parsers import search_queries_parser, enhanced_modules_pars
 from backend.services.services import get_llm, perform_search_and_scrape, get_llm_with_search
 from langchain_core.prompts import ChatPromptTemplate
 
-from backend.core.graph_nodes.helpers import run_chain, batch_items, format_search_results, escape_curly_braces, MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT, extract_json_from_markdown
+from backend.core.graph_nodes.helpers import run_chain, batch_items, format_search_results, escape_curly_braces, extract_json_from_markdown, get_format_instructions, is_transient_error, get_retry_delay
 from backend.core.graph_nodes.search_utils import execute_search_with_llm_retry
 
-async def generate_search_queries(state: LearningPathState) -> Dict[str, Any]:
-    """
-    Generates optimal search queries for the user topic using an LLM chain.
-    Enhanced with better error handling and JSON extraction.
-    
-    Args:
-        state: The current LearningPathState with 'user_topic'.
-        
-    Returns:
-        A dictionary containing the generated search queries and a list of execution steps.
-    """
-    logging.info(f"Generating search queries for topic: {state['user_topic']}")
-    
-    # Send progress update if callback is available
-    progress_callback = state.get('progress_callback')
-    if progress_callback:
-        # Use enhanced progress update with phase information
-        await progress_callback(
-            f"Analyzing topic '{state['user_topic']}' to generate optimal search queries...",
-            phase="search_queries",
-            phase_progress=0.1,
-            overall_progress=0.2,
-            action="processing"
-        )
-    
-    # Get language information from state
-    output_language = state.get('language', 'en')
-    search_language = state.get('search_language', 'en')
-    
-    # Improved prompt template with better structure and formatting
-    prompt_text = """# EXPERT LEARNING PATH ARCHITECT & CURRICULUM DESIGNER
+# Maximum characters of each scraped result fed to the course structure prompt.
+# Only the module outline is designed from this context, so a few KB per source
+# is enough, and it keeps the prompt well inside the model's context window.
+MAX_CONTENT_CHARS = 4000
+
+# Map step of create_learning_path: each query's sources are condensed by a
+# separate LLM call before the module synthesis prompt sees them. Contexts that
+# are already short are passed through verbatim, since a summary would not save
+# anything worth the extra round trip.
+SUMMARY_MIN_CHARS = 2000
+SUMMARY_MAX_WORDS = 300
+SUMMARY_MAX_ATTEMPTS = 3
+# Concurrent summary calls; kept low so the burst stays within Gemini's per-minute
+# token quota, since each call sends up to 5 x MAX_CONTENT_CHARS of sources
+SUMMARY_PARALLEL_COUNT = 3
+
+# --- Prompt templates ---
+# Static templates are built once at import instead of on every node invocation.
+
+_SEARCH_QUERY_PROMPT_TEXT = """# EXPERT LEARNING PATH ARCHITECT & CURRICULUM DESIGNER
 
 Your task is to generate 5 diverse search queries that will gather the necessary information to DESIGN an optimal and comprehensive course for the topic: {user_topic}.
 
@@ -90,6 +79,131 @@ Your response must be valid JSON with this exact format:
 
 Do not wrap your response in markdown code blocks. Return only the JSON object."""
 
+_SEARCH_QUERY_PROMPT = ChatPromptTemplate.from_template(_SEARCH_QUERY_PROMPT_TEXT)
+
+_STRUCTURE_QUERY_RETRY_PROMPT_TEXT = """# SEARCH QUERY RETRY SPECIALIST
+
+The following search query returned NO RESULTS when searching for information about how to structure a course:
+
+FAILED QUERY: {failed_query}
+TOPIC: {user_topic}
+
+I need you to generate a DIFFERENT search query that is more likely to find results but still focused on retrieving STRUCTURAL and ORGANIZATIONAL information about learning this topic.
+
+## NEW QUERY REQUIREMENTS
+
+Create ONE alternative search query that:
+1. Is BROADER or uses more common terminology
+2. Maintains focus on curriculum design, course structure, and module organization
+3. Uses fewer quoted phrases (one at most)
+4. Is more likely to match existing educational content
+5. Balances specificity with generality
+
+## LANGUAGE INSTRUCTIONS
+- Generate your response in {output_language}.
+- For the search query, use {search_language} to maximize retrieving high-quality information.
+
+Your response must be valid JSON with this exact format:
+{{
+  "keywords": "new search query here",
+  "rationale": "brief explanation why this query might work better"
+}}
+
+Do not wrap your response in markdown code blocks. Return only the JSON object."""
+
+_STRUCTURE_QUERY_RETRY_PROMPT = ChatPromptTemplate.from_template(_STRUCTURE_QUERY_RETRY_PROMPT_TEXT)
+
+_LEARNING_PATH_PROMPT_TEXT = """# EXPERT CURRICULUM ARCHITECT INSTRUCTIONS
+
+You are a world-class curriculum architect with expertise in educational design. Transform the following search results into a cohesive, comprehensive course on {topic}.
+
+## SEARCH CONTEXT
+{search_results}
+
+## CURRICULUM REQUIREMENTS
+- Language: {language_instruction}
+- Module Count: {module_count_instruction}
+{style_instruction_part}
+
+## DESIGN PRINCIPLES
+1. **Evidence-Based Structure**: Analyze the search results to identify key concepts, standard approaches, and natural divisions within this subject.
+2. **Progressive Complexity**: Arrange modules in a sequence that builds knowledge systematically from foundations to advanced concepts.
+3. **Conceptual Independence**: Each module must cover a distinct aspect of the topic with minimal overlap.
+4. **Collective Completeness**: Together, all modules must comprehensively cover the entire subject.
+
+## MODULE CREATION INSTRUCTIONS
+For each module, provide:
+
+1. **Title**: A clear, descriptive title reflecting the module's core focus (8-10 words maximum)
+2. **Overview**: A comprehensive explanation of the module's content and scope (100-200 words)
+3. **Primary Objective**: ONE specific, measurable learning outcome expressed as: "After completing this module, learners will be able to..." (1 sentence)
+4. **Strategic Relevance**: Explain this module's importance in the overall learning journey and how it connects to other modules (2-3 sentences)
+
+## RESPONSE FORMAT
+Your response must be valid JSON with this exact structure:
+{{{{
+  "modules": [
+    {{{{
+      "title": "Module title here",
+      "description": "Comprehensive overview here",
+      "learning_objective": "After completing this module, learners will be able to...",
+      "strategic_relevance": "Explanation of importance and connections"
+    }}}}
+  ]
+}}}}
+
+Do not wrap your response in markdown code blocks. Return only the JSON object."""
+
+_LEARNING_PATH_PROMPT = ChatPromptTemplate.from_template(_LEARNING_PATH_PROMPT_TEXT)
+
+_SEARCH_RESULT_SUMMARY_PROMPT_TEXT = """# SEARCH RESULT SUMMARIZER
+
+You are helping a curriculum architect design a course on {topic}. Below are the sources retrieved for ONE search query. Condense them into a summary that keeps only what matters for designing the course structure.
+
+SEARCH QUERY: {query}
+
+## SOURCES
+{sources}
+
+## SUMMARY INSTRUCTIONS
+- Capture the key concepts, prerequisites, sub-topics, natural learning sequence, practical skills and common difficulties mentioned in the sources.
+- Preserve concrete terminology, and mention which source (URL) each important point comes from.
+- Omit navigation text, advertising and anything unrelated to {topic}.
+- Do not invent information that is not present in the sources.
+- Write the summary in {output_language}, in at most {max_words} words, as plain text or bullet points."""
+
+_SEARCH_RESULT_SUMMARY_PROMPT = ChatPromptTemplate.from_template(_SEARCH_RESULT_SUMMARY_PROMPT_TEXT)
+# --- End prompt templates ---
+
+async def generate_search_queries(state: LearningPathState) -> Dict[str, Any]:
+    """
+    Generates optimal search queries for the user topic using an LLM chain.
+    Enhanced with better error handling and JSON extraction.
+    
+    Args:
+        state: The current LearningPathState with 'user_topic'.
+        
+    Returns:
+        A dictionary containing the generated search queries and a list of execution steps.
+    """
+    logging.info("Generating search queries for topic: %s", state['user_topic'])
+    
+    # Send progress update if callback is available
+    progress_callback = state.get('progress_callback')
+    if progress_callback:
+        # Use enhanced progress update with phase information
+        await progress_callback(
+            f"Analyzing topic '{state['user_topic']}' to generate optimal search queries...",
+            phase="search_queries",
+            phase_progress=0.1,
+            overall_progress=0.2,
+            action="processing"
+        )
+    
+    # Get language information from state
+    output_language = state.get('language', 'en')
+    search_language = state.get('search_language', 'en')
+    
     try:
         # Get Google key provider from state
         google_key_provider = state.get("google_key_provider")
@@ -108,21 +222,19 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
                 action="processing"
             )
         
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_template(prompt_text)
-        
         # Prepare parameters - carefully escape any user input
         escaped_user_topic = escape_curly_braces(state["user_topic"])
         
         # Use the enhanced run_chain with better error handling
         result = await run_chain(
-            prompt, 
+            _SEARCH_QUERY_PROMPT, 
             lambda: get_llm(key_provider=google_key_provider, user=state.get('user')), 
             search_queries_parser, 
             {
                 "user_topic": escaped_user_topic,
                 "output_language": output_language,
                 "search_language": search_language,
+                "format_instructions": get_format_instructions(search_queries_parser),
             },
             max_retries=3,
             retry_parsing_errors=True,
@@ -130,7 +242,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
         )
         
         search_queries = result.queries
-        logging.info(f"Generated {len(search_queries)} search queries")
+        logging.info("Generated %d search queries", len(search_queries))
         
         # Prepare preview data for frontend display
         preview_data = {
@@ -157,7 +269,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
         }
         
     except Exception as e:
-        logging.error(f"Error generating search queries: {str(e)}")
+        logging.error("Error generating search queries: %s", e)
         
         # Try fallback approach with simpler queries
         try:
@@ -179,7 +291,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
             }
             
         except Exception as fallback_error:
-            logging.error(f"Fallback query generation also failed: {str(fallback_error)}")
+            logging.error("Fallback query generation also failed: %s", fallback_error)
             
             # Send error progress update
             if progress_callback:
@@ -224,7 +336,7 @@ async def generate_fallback_queries(state: LearningPathState) -> List[SearchQuer
         )
     ]
     
-    logging.info(f"Generated {len(fallback_queries)} fallback queries")
+    logging.info("Generated %d fallback queries", len(fallback_queries))
     return fallback_queries
 
 async def regenerate_initial_structure_query(
@@ -235,7 +347,7 @@ async def regenerate_initial_structure_query(
     Regenerates a search query for course structure after a "no results found" error.
     Enhanced with better error handling.
     """
-    logging.info(f"Regenerating structure query after no results for: {failed_query.keywords}")
+    logging.info("Regenerating structure query after no results for: %s", failed_query.keywords)
     
     # Get language information from state
     output_language = state.get('language', 'en')
@@ -251,42 +363,10 @@ async def regenerate_initial_structure_query(
             rationale="Simplified query for course structure information"
         )
     
-    prompt_text = """# SEARCH QUERY RETRY SPECIALIST
-
-The following search query returned NO RESULTS when searching for information about how to structure a course:
-
-FAILED QUERY: {failed_query}
-TOPIC: {user_topic}
-
-I need you to generate a DIFFERENT search query that is more likely to find results but still focused on retrieving STRUCTURAL and ORGANIZATIONAL information about learning this topic.
-
-## NEW QUERY REQUIREMENTS
-
-Create ONE alternative search query that:
-1. Is BROADER or uses more common terminology
-2. Maintains focus on curriculum design, course structure, and module organization
-3. Uses fewer quoted phrases (one at most)
-4. Is more likely to match existing educational content
-5. Balances specificity with generality
-
-## LANGUAGE INSTRUCTIONS
-- Generate your response in {output_language}.
-- For the search query, use {search_language} to maximize retrieving high-quality information.
-
-Your response must be valid JSON with this exact format:
-{{
-  "keywords": "new search query here",
-  "rationale": "brief explanation why this query might work better"
-}}
-
-Do not wrap your response in markdown code blocks. Return only the JSON object."""
-
     try:
-        prompt = ChatPromptTemplate.from_template(prompt_text)
-        
         # Use a simpler approach that directly gets the LLM response
         llm = await get_llm(key_provider=google_key_provider, user=state.get('user'))
-        chain = prompt | llm
+        chain = _STRUCTURE_QUERY_RETRY_PROMPT | llm
         
         response = await chain.ainvoke({
             "failed_query": failed_query.keywords,
@@ -304,13 +384,13 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
                 keywords=json_data["keywords"],
                 rationale=json_data.get("rationale", "Regenerated query")
             )
-            logging.info(f"Successfully regenerated structure query: {regenerated_query.keywords}")
+            logging.info("Successfully regenerated structure query: %s", regenerated_query.keywords)
             return regenerated_query
         else:
             raise Exception("Could not extract valid JSON from regeneration response")
             
     except Exception as e:
-        logging.error(f"Error regenerating structure query: {str(e)}")
+        logging.error("Error regenerating structure query: %s", e)
         # Return a simple fallback
         return SearchQuery(
             keywords=f"{state['user_topic']} learning guide tutorial",
@@ -356,7 +436,10 @@ async def execute_web_searches(state: LearningPathState) -> Dict[str, Any]:
     # Get max results from env or default
     max_results_per_query = int(os.environ.get("SEARCH_MAX_RESULTS", 5))
     
-    logging.info(f"Executing {len(search_queries)} web searches (Brave+Scrape) with parallelism={search_parallel_count}, max_results={max_results_per_query}, scrape_timeout={scrape_timeout}")
+    logging.info(
+        "Executing %d web searches (Brave+Scrape) with parallelism=%d, max_results=%d, scrape_timeout=%d",
+        len(search_queries), search_parallel_count, max_results_per_query, scrape_timeout
+    )
     
     # Send progress update if callback is available
     progress_callback = state.get('progress_callback')
@@ -370,31 +453,61 @@ async def execute_web_searches(state: LearningPathState) -> Dict[str, Any]:
             action="started"
         )
     
-    all_search_service_results: List[SearchServiceResult] = [] # Store results of the new type
+    # Results are stored by query index so downstream nodes see them in query order,
+    # even though they are consumed in completion order below
+    results_by_index: List[Optional[SearchServiceResult]] = [None] * len(search_queries)
     
     try:
         # Create a semaphore to limit concurrency
         sem = asyncio.Semaphore(search_parallel_count)
         
-        async def bounded_search_with_retry(query_obj: SearchQuery):
+        async def bounded_search_with_retry(index: int, query_obj: SearchQuery):
             async with sem:
                 # Set operation name for tracking
                 provider = brave_key_provider.set_operation("initial_web_search")
                 
                 # Use the new function with retry capability
-                return await execute_search_with_llm_retry(
-                    state=state,
-                    initial_query=query_obj,
-                    regenerate_query_func=regenerate_initial_structure_query,
-                    search_provider_key_provider=provider,
-                    search_config={
-                        "max_results": max_results_per_query,
-                        "scrape_timeout": scrape_timeout
-                    }
-                )
+                try:
+                    result = await execute_search_with_llm_retry(
+                        state=state,
+                        initial_query=query_obj,
+                        regenerate_query_func=regenerate_initial_structure_query,
+                        search_provider_key_provider=provider,
+                        search_config={
+                            "max_results": max_results_per_query,
+                            "scrape_timeout": scrape_timeout
+                        }
+                    )
+                except Exception as e:
+                    # Handle unexpected errors from the search task itself, keeping the index
+                    logging.exception("Error processing search task for query '%s': %s", query_obj.keywords, e)
+                    result = SearchServiceResult(
+                        query=query_obj.keywords,
+                        results=[],
+                        search_provider_error=f"Task execution error: {type(e).__name__} - {str(e)}"
+                    )
+                return index, result
+        
+        # Queries with the same keywords (ignoring case/whitespace) are searched only once;
+        # the result is fanned out to every position that asked for it
+        duplicate_indices: Dict[int, List[int]] = {}
+        first_index_by_key: Dict[str, int] = {}
+        for index, query in enumerate(search_queries):
+            key = query.keywords.strip().lower()
+            if key in first_index_by_key:
+                duplicate_indices[first_index_by_key[key]].append(index)
+            else:
+                first_index_by_key[key] = index
+                duplicate_indices[index] = []
+        if len(first_index_by_key) < len(search_queries):
+            logging.info("Skipping %d duplicate search queries", len(search_queries) - len(first_index_by_key))
         
-        # Create tasks for all searches
-        tasks = [bounded_search_with_retry(query) for query in search_queries]
+        # Launch all searches at once; the semaphore bounds how many run concurrently,
+        # so a fast search frees its slot immediately instead of waiting for a whole batch
+        tasks = [
+            asyncio.create_task(bounded_search_with_retry(index, search_queries[index]))
+            for index in first_index_by_key.values()
+        ]
         
         if progress_callback and len(tasks) > 0:
             await progress_callback(
@@ -405,80 +518,78 @@ async def execute_web_searches(state: LearningPathState) -> Dict[str, Any]:
                 action="processing"
             )
         
-        # Run all tasks in parallel with bounded concurrency
+        # Consume results as they complete
         completed = 0
         total = len(tasks)
+        completed_keywords: List[str] = []
         
-        for i, future in enumerate(asyncio.as_completed(tasks)):
-            scrape_errors = [] # Initialize scrape_errors before try block
-            try:
-                # Get the result (SearchServiceResult object)
-                result: SearchServiceResult = await future
-                all_search_service_results.append(result)
+        try:
+            for future in asyncio.as_completed(tasks):
+                # Get the (index, SearchServiceResult) pair
+                index, result = await future
+                results_by_index[index] = result
+                for duplicate_index in duplicate_indices[index]:
+                    results_by_index[duplicate_index] = result
                 completed += 1
-                current_query_keywords = search_queries[i].keywords # Get keywords from original list by index
+                current_query_keywords = search_queries[index].keywords
+                completed_keywords.append(current_query_keywords)
                 
                 # Log search provider errors if any
                 if result.search_provider_error:
-                    logging.error(f"Search provider error for query '{current_query_keywords}': {result.search_provider_error}")
+                    logging.error("Search provider error for query '%s': %s", current_query_keywords, result.search_provider_error)
                 # Log summary of scrape errors
                 scrape_errors = [r.scrape_error for r in result.results if r.scrape_error]
                 if scrape_errors:
-                    logging.warning(f"Scraping issues for query '{current_query_keywords}': {len(scrape_errors)}/{len(result.results)} URLs failed. Errors: {scrape_errors[:2]}...") # Log first few errors
-                
-            except Exception as e:
-                # Handle potential errors from the await future itself (e.g., task cancellation)
-                query_keywords = search_queries[i].keywords
-                logging.exception(f"Error processing search task for query '{query_keywords}': {e}")
-                # Append a placeholder result indicating the task error
-                all_search_service_results.append(
-                    SearchServiceResult(
-                        query=query_keywords,
-                        results=[],
-                        search_provider_error=f"Task execution error: {type(e).__name__} - {str(e)}"
-                    )
-                )
-                # We count it as completed for progress purposes, even though it failed
-                completed += 1
-            
-            # Send incremental progress updates
-            if progress_callback and i < len(search_queries):
-                phase_progress = min(1.0, completed / total)
-                overall_progress = 0.25 + (phase_progress * 0.15) # web searches are 15% of overall process
+                    logging.warning("Scraping issues for query '%s': %d/%d URLs failed. Errors: %s...", current_query_keywords, len(scrape_errors), len(result.results), scrape_errors[:2]) # Log first few errors
                 
-                # Create preview data (show completed query)
-                preview_data = {
-                    "search_queries": [q.keywords for q in search_queries[:i+1]],
-                    "current_search": {
-                        "query": search_queries[i].keywords,
-                        "completed": completed,
-                        "total": total,
-                        # Add info about scrape success/failure?
-                        "scrape_status": f"{len(all_search_service_results[-1].results) - len(scrape_errors)}/{len(all_search_service_results[-1].results)} scraped" if all_search_service_results else "N/A"
+                # Send incremental progress updates
+                if progress_callback:
+                    phase_progress = min(1.0, completed / total)
+                    overall_progress = 0.25 + (phase_progress * 0.15) # web searches are 15% of overall process
+                    
+                    # Create preview data (show completed query)
+                    preview_data = {
+                        "search_queries": list(completed_keywords),
+                        "current_search": {
+                            "query": current_query_keywords,
+                            "completed": completed,
+                            "total": total,
+                            "scrape_status": f"{len(result.results) - len(scrape_errors)}/{len(result.results)} scraped"
+                        }
                     }
-                }
-                
-                # Throttle detailed updates
-                if i % 2 == 0 or i == len(search_queries) - 1:
-                    next_idx = min(i + 1, len(search_queries) - 1)
-                    next_message = f"Completed {completed}/{total} searches. "
-                    if completed < total and next_idx < len(search_queries):
-                         next_message += f"Searching & scraping for '{search_queries[next_idx].keywords}'..."
                     
-                    await progress_callback(
-                        next_message,
-                        phase="web_searches",
-                        phase_progress=phase_progress,
-                        overall_progress=overall_progress,
-                        preview_data=preview_data,
-                        action="processing"
-                    )
+                    # Throttle detailed updates
+                    if completed % 2 == 1 or completed == total:
+                        next_message = f"Completed {completed}/{total} searches. "
+                        pending_keywords = [
+                            search_queries[i].keywords for i, r in enumerate(results_by_index) if r is None
+                        ]
+                        if pending_keywords:
+                            next_message += f"Searching & scraping for '{pending_keywords[0]}'..."
+                        
+                        await progress_callback(
+                            next_message,
+                            phase="web_searches",
+                            phase_progress=phase_progress,
+                            overall_progress=overall_progress,
+                            preview_data=preview_data,
+                            action="processing"
+                        )
+        finally:
+            # Don't leave searches running if we bail out early
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        all_search_service_results = [r for r in results_by_index if r is not None]
         
-        logging.info(f"Completed {len(all_search_service_results)} web searches (Brave+Scrape)")
+        # Count distinct searches, matching the per-result updates above; duplicate
+        # queries share a result but were not searched again
+        logging.info("Completed %d web searches (Brave+Scrape) for %d queries", total, len(all_search_service_results))
         
         if progress_callback:
             await progress_callback(
-                f"Completed all {len(all_search_service_results)} web searches",
+                f"Completed all {total} web searches",
                 phase="web_searches",
                 phase_progress=1.0,
                 overall_progress=0.4,
@@ -488,11 +599,11 @@ async def execute_web_searches(state: LearningPathState) -> Dict[str, Any]:
         
         return {
             "search_results": all_search_service_results, # Return the list of SearchServiceResult objects
-            "steps": state.get("steps", []) + [f"Executed {len(all_search_service_results)} web searches (Brave+Scrape)"]
+            "steps": state.get("steps", []) + [f"Executed {total} web searches (Brave+Scrape)"]
         }
     except Exception as e:
         # Catch errors during task setup or semaphore handling
-        logging.exception(f"Error setting up or running web search tasks: {str(e)}")
+        logging.exception("Error setting up or running web search tasks: %s", e)
         if progress_callback:
             await progress_callback(
                 f"Error during web searches setup: {str(e)}",
@@ -502,10 +613,103 @@ async def execute_web_searches(state: LearningPathState) -> Dict[str, Any]:
                 action="error"
             )
         return {
-            "search_results": all_search_service_results, # Return whatever was collected
+            "search_results": [r for r in results_by_index if r is not None], # Return whatever was collected
             "steps": state.get("steps", []) + [f"Error executing web searches setup: {str(e)}"]
         }
 
+async def summarize_search_result(
+    state: LearningPathState,
+    llm: Any,
+    query: str,
+    context_text: str
+) -> Optional[str]:
+    """
+    Condenses the sources retrieved for one search query into a short summary.
+    Rate limits and other transient errors are retried with the same backoff as run_chain.
+
+    Args:
+        state: The current LearningPathState.
+        llm: The LLM instance shared by all summary calls of this run.
+        query: The search query the sources were retrieved for.
+        context_text: The formatted (brace-escaped) sources for the query.
+
+    Returns:
+        The brace-escaped summary, or None if the summary could not be generated.
+    """
+    chain = _SEARCH_RESULT_SUMMARY_PROMPT | llm
+    for attempt in range(1, SUMMARY_MAX_ATTEMPTS + 1):
+        try:
+            response = await chain.ainvoke({
+                "topic": state["user_topic"],
+                "query": query,
+                "sources": context_text,
+                "output_language": state.get('language', 'en'),
+                "max_words": SUMMARY_MAX_WORDS,
+            })
+            summary = response.content if hasattr(response, 'content') else str(response)
+            summary = summary.strip()
+            if not summary:
+                raise ValueError("Empty summary returned")
+            return escape_curly_braces(summary)
+        except Exception as e:
+            if attempt < SUMMARY_MAX_ATTEMPTS and is_transient_error(e):
+                delay = get_retry_delay(e, attempt)
+                logging.warning("Transient error summarizing search results for query '%s' (attempt %d/%d), retrying in %.2fs: %s",
+                                query, attempt, SUMMARY_MAX_ATTEMPTS, delay, e)
+                await asyncio.sleep(delay)
+                continue
+            logging.warning("Could not summarize search results for query '%s', using raw content: %s", query, e)
+            return None
+    return None
+
+async def summarize_search_results(
+    state: LearningPathState,
+    report_contexts: List[tuple]
+) -> List[str]:
+    """
+    Summarizes the context of every search query in parallel.
+
+    Args:
+        state: The current LearningPathState.
+        report_contexts: (query, context_text) pairs in search order.
+
+    Returns:
+        One context string per query, in the same order as report_contexts.
+    """
+    to_summarize = [
+        index for index, (_, context_text) in enumerate(report_contexts)
+        if len(context_text) >= SUMMARY_MIN_CHARS
+    ]
+    contexts = [context_text for _, context_text in report_contexts]
+    if not to_summarize:
+        return contexts
+
+    try:
+        llm = await get_llm(key_provider=state.get("google_key_provider"), user=state.get('user'))
+    except Exception as e:
+        logging.warning("Could not initialize LLM for search result summaries, using raw content: %s", e)
+        return contexts
+
+    logging.info("Summarizing search results for %d of %d queries", len(to_summarize), len(report_contexts))
+    sem = asyncio.Semaphore(SUMMARY_PARALLEL_COUNT)
+
+    async def summarize_with_limit(index: int) -> Optional[str]:
+        query, context_text = report_contexts[index]
+        async with sem:
+            return await summarize_search_result(state, llm, query, context_text)
+
+    summaries = await asyncio.gather(*(summarize_with_limit(index) for index in to_summarize))
+    fallback_count = 0
+    for index, summary in zip(to_summarize, summaries):
+        if summary is None:
+            # Keep the raw context for this query
+            fallback_count += 1
+        else:
+            contexts[index] = summary
+    if fallback_count:
+        logging.info("Used raw content for %d of %d search result summaries", fallback_count, len(to_summarize))
+    return contexts
+
 async def create_learning_path(state: LearningPathState) -> Dict[str, Any]:
     """
     Create a structured course from the scraped search results.
@@ -514,6 +718,16 @@ async def create_learning_path(state: LearningPathState) -> Dict[str, Any]:
     # Type hint for clarity
     search_service_results: Optional[List[SearchServiceResult]] = state.get("search_results")
 
+    # Drop failed searches and results without any content up front; they add nothing
+    # to the prompt but would still be escaped and serialized
+    usable_results = [
+        report for report in (search_service_results or [])
+        if any(res.scraped_content or res.search_snippet for res in report.results)
+    ]
+    if search_service_results and len(usable_results) < len(search_service_results):
+        logging.info("Skipping %d search results without usable content", len(search_service_results) - len(usable_results))
+    search_service_results = usable_results
+
     if not search_service_results or len(search_service_results) == 0:
         logging.info("No search results available to create course")
         return {
@@ -565,48 +779,53 @@ async def create_learning_path(state: LearningPathState) -> Dict[str, Any]:
 
     try:
         # Process the new search results structure for the LLM prompt
-        context_parts = []
+        report_contexts = []
         max_context_per_query = 5 # Limit number of results per query used in context
+        _esc = escape_curly_braces # Local alias, looked up once for the hot loop below
 
+        seen_queries = set()
         for report in search_service_results:
-            query = escape_curly_braces(report.query)
-            context_parts.append(f"\n## Search Results for Query: \"{query}\"\n")
-
+            # execute_web_searches places the same result at every duplicate query's
+            # position; include and summarize each search only once
+            query_key = report.query.strip().lower()
+            if query_key in seen_queries:
+                continue
+            seen_queries.add(query_key)
+
+            context_parts = []
             results_included = 0
             for res in report.results:
                 if results_included >= max_context_per_query:
                     break
 
-                title = escape_curly_braces(res.title or 'N/A')
-                url = res.url # URLs are usually safe
-                context_parts.append(f"### Result from: {url} (Title: {title})")
-
+                # Results with neither scraped content nor a snippet are omitted from this prompt
                 if res.scraped_content:
-                    content = escape_curly_braces(res.scraped_content)
-                    truncated_content = content[:MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT]
-                    if len(content) > MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT:
-                        truncated_content += "... (truncated)"
-                    context_parts.append(f"Scraped Content Snippet:\n{truncated_content}")
-                    results_included += 1
+                    label = "Scraped Content Snippet:"
+                    text = res.scraped_content
                 elif res.search_snippet:
-                    snippet = escape_curly_braces(res.search_snippet)
-                    error_info = f" (Scraping failed: {escape_curly_braces(res.scrape_error or 'Unknown error')})"
-                    truncated_snippet = snippet[:MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT]
-                    if len(snippet) > MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT:
-                         truncated_snippet += "... (truncated)"
-                    context_parts.append(f"Search Snippet:{error_info}\n{truncated_snippet}")
-                    results_included += 1
+                    label = f"Search Snippet: (Scraping failed: {_esc(res.scrape_error or 'Unknown error')})"
+                    text = res.search_snippet
                 else:
-                     # If scrape failed and no snippet, mention the failure
-                     error_info = f" (Scraping failed: {escape_curly_braces(res.scrape_error or 'Unknown error')})"
-                     # context_parts.append(f"Content: Not available.{error_info}") # Let's omit results with no content at all for this prompt
-                     # Optionally decide if this counts towards max_context_per_query
-
-                context_parts.append("---")
-            if results_included == 0:
-                 context_parts.append("(No usable content found for this query)")
-
-        results_text = "\n".join(context_parts)
+                    continue
+
+                # Truncate before escaping so only the text that reaches the prompt is processed,
+                # and emit each result as a single string instead of several list entries
+                title = _esc(res.title or 'N/A')
+                truncated_marker = "... (truncated)" if len(text) > MAX_CONTENT_CHARS else ""
+                context_parts.append(
+                    f"### Result from: {res.url} (Title: {title})\n"  # URLs are usually safe
+                    f"{label}\n{_esc(text[:MAX_CONTENT_CHARS])}{truncated_marker}\n---"
+                )
+                results_included += 1
+            report_contexts.append((report.query, "\n".join(context_parts)))
+
+        # Map: condense each query's sources in parallel, then reduce the summaries
+        # in query order into the context of the module synthesis prompt
+        summaries = await summarize_search_results(state, report_contexts)
+        results_text = "\n".join(
+            f"\n## Search Results for Query: \"{_esc(query)}\"\n\n{summary}"
+            for (query, _), summary in zip(report_contexts, summaries)
+        )
 
         # Check if a specific number of modules was requested
         module_count_instruction = ""
@@ -634,52 +853,8 @@ async def create_learning_path(state: LearningPathState) -> Dict[str, Any]:
         if explanation_style_description:
             style_instruction_part = f"\n\n**Style Requirement:** Write all module titles and descriptions using the following style: **{explanation_style_description}**"
 
-        # Improved prompt text with proper template variables and escaping
-        prompt_text = """# EXPERT CURRICULUM ARCHITECT INSTRUCTIONS
-
-You are a world-class curriculum architect with expertise in educational design. Transform the following search results into a cohesive, comprehensive course on {topic}.
-
-## SEARCH CONTEXT
-{search_results}
-
-## CURRICULUM REQUIREMENTS
-- Language: {language_instruction}
-- Module Count: {module_count_instruction}
-{style_instruction_part}
-
-## DESIGN PRINCIPLES
-1. **Evidence-Based Structure**: Analyze the search results to identify key concepts, standard approaches, and natural divisions within this subject.
-2. **Progressive Complexity**: Arrange modules in a sequence that builds knowledge systematically from foundations to advanced concepts.
-3. **Conceptual Independence**: Each module must cover a distinct aspect of the topic with minimal overlap.
-4. **Collective Completeness**: Together, all modules must comprehensively cover the entire subject.
-
-## MODULE CREATION INSTRUCTIONS
-For each module, provide:
-
-1. **Title**: A clear, descriptive title reflecting the module's core focus (8-10 words maximum)
-2. **Overview**: A comprehensive explanation of the module's content and scope (100-200 words)
-3. **Primary Objective**: ONE specific, measurable learning outcome expressed as: "After completing this module, learners will be able to..." (1 sentence)
-4. **Strategic Relevance**: Explain this module's importance in the overall learning journey and how it connects to other modules (2-3 sentences)
-
-## RESPONSE FORMAT
-Your response must be valid JSON with this exact structure:
-{{{{
-  "modules": [
-    {{{{
-      "title": "Module title here",
-      "description": "Comprehensive overview here",
-      "learning_objective": "After completing this module, learners will be able to...",
-      "strategic_relevance": "Explanation of importance and connections"
-    }}}}
-  ]
-}}}}
-
-Do not wrap your response in markdown code blocks. Return only the JSON object."""
-
-        prompt = ChatPromptTemplate.from_template(prompt_text)
-
         result = await run_chain(
-            prompt,
+            _LEARNING_PATH_PROMPT,
             lambda: get_llm_with_search(key_provider=google_key_provider, user=state.get('user')),
             enhanced_modules_parser,
             {
@@ -688,6 +863,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
                 "language_instruction": language_instruction,
                 "module_count_instruction": module_count_instruction,
                 "style_instruction_part": style_instruction_part,
+                "format_instructions": get_format_instructions(enhanced_modules_parser),
             },
             max_retries=3,
             retry_parsing_errors=True,
@@ -696,7 +872,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
         modules = result.modules
 
         if state.get("desired_module_count") and len(modules) != state["desired_module_count"]:
-            logging.warning(f"Requested {state['desired_module_count']} modules but got {len(modules)}. Trimming/padding may occur.")
+            logging.warning("Requested %d modules but got %d. Trimming/padding may occur.", state['desired_module_count'], len(modules))
             if len(modules) > state["desired_module_count"]:
                 modules = modules[:state["desired_module_count"]]
             # Padding is harder, let the LLM handle it ideally
@@ -705,12 +881,12 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
             "topic": state["user_topic"],
             "modules": modules,
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": state.get("run_started_at") or datetime.now(timezone.utc).isoformat(),
                 "num_modules": len(modules)
             }
         }
 
-        logging.info(f"Created course structure with {len(modules)} modules")
+        logging.info("Created course structure with %d modules", len(modules))
 
         preview_modules = []
         for module_index, module in enumerate(modules):
@@ -746,7 +922,7 @@ Do not wrap your response in markdown code blocks. Return only the JSON object."
             "steps": state.get("steps", []) + [f"Created course structure with {len(modules)} modules"]
         }
     except Exception as e:
-        logging.exception(f"Error creating course: {str(e)}")
+        logging.exception("Error creating course: %s", e)
         if progress_callback:
             await progress_callback(
                 f"Error creating course: {str(e)}",
@@ -34,7 +34,7 @@ from backend.prompts.learning_path_prompts import (
     RESOURCE_EXTRACTION_PROMPT
 )
 
-from backend.core.graph_nodes.helpers import run_chain, escape_curly_braces, MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT
+from backend.core.graph_nodes.helpers import run_chain, escape_curly_braces, get_format_instructions, MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT
 from backend.core.graph_nodes.search_utils import execute_search_with_llm_retry
 
 # Configure logger
@@ -105,7 +105,7 @@ async def generate_topic_resources(state: LearningPathState) -> Dict[str, Any]:
             "learning_path_context": learning_path_context,
             "language": output_language,
             "search_language": search_language,
-            "format_instructions": resource_query_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(resource_query_parser)
         })
         resource_query = query_result # ResourceQuery object
 
@@ -208,7 +208,7 @@ async def generate_topic_resources(state: LearningPathState) -> Dict[str, Any]:
                 # Provide URLs separately for potential reference by the LLM
                 "search_citations": source_urls_for_llm,
                 "resource_count": 6,  # Number of desired resources
-                "format_instructions": resource_list_parser.get_format_instructions()
+                "format_instructions": get_format_instructions(resource_list_parser)
             }
         )
 
@@ -318,7 +318,7 @@ async def generate_module_resources(state: LearningPathState, module_id: int, mo
             "learning_path_context": learning_path_context,
             "language": output_language,
             "search_language": search_language,
-            "format_instructions": resource_query_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(resource_query_parser)
         })
         resource_query = query_result
 
@@ -418,7 +418,7 @@ async def generate_module_resources(state: LearningPathState, module_id: int, mo
                 "search_results": search_results_context_for_llm,
                 "search_citations": source_urls_for_llm,
                 "resource_count": 4,  # Desired resource count for modules
-                "format_instructions": resource_list_parser.get_format_instructions()
+                "format_instructions": get_format_instructions(resource_list_parser)
             }
         )
 
@@ -571,7 +571,7 @@ async def generate_submodule_resources(
             "adjacent_context": adjacent_context,
             "language": output_language,
             "search_language": search_language,
-            "format_instructions": resource_query_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(resource_query_parser)
         })
         resource_query = query_result
 
@@ -686,7 +686,7 @@ async def generate_submodule_resources(
                 "search_results": search_results_context_for_llm,
                 "search_citations": source_urls_for_llm,
                 "resource_count": 3,  # Desired resource count for submodules
-                "format_instructions": resource_list_parser.get_format_instructions()
+                "format_instructions": get_format_instructions(resource_list_parser)
             }
         )
 
@@ -1161,7 +1161,7 @@ Your response should include just ONE search query and a brief rationale for why
             "resource_level_context": resource_level_context,
             "output_language": output_language,
             "search_language": search_language,
-            "format_instructions": resource_query_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(resource_query_parser)
         })
         
         if not result or not hasattr(result, 'query'):
@@ -9,7 +9,11 @@ import logging
 import re
 import asyncio # Added for sleep
 import random   # Added for jitter
-from typing import Callable, Dict, Any, Optional, TypeVar, Awaitable, Union
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, TypeVar, Awaitable, Union, Tuple
 
 from backend.models.models import SearchQuery, LearningPathState, SearchServiceResult, ResourceQuery
 from backend.services.services import perform_search_and_scrape
@@ -24,6 +28,41 @@ QueryObjectType = Union[SearchQuery, ResourceQuery]
 # Define max attempts constant
 MAX_SEARCH_ATTEMPTS = 4
 
+# In-memory cache of successful search results so repeated queries skip Brave + scraping.
+# Entries hold full scraped pages (up to 100k characters each), so a full cache can reach
+# tens of MB, and each hit deep-copies its entry.
+SEARCH_CACHE_MAX_ENTRIES = 128
+SEARCH_CACHE_TTL_SECONDS = 3600
+_search_cache: "OrderedDict[str, Tuple[float, SearchServiceResult]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+def _search_cache_key(query: str, search_language: str, max_results: int) -> str:
+    """Build a stable cache key for a search query and its settings."""
+    raw = f"{query.strip().lower()}\x00{search_language}\x00{max_results}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+def _get_cached_search_result(cache_key: str) -> Optional[SearchServiceResult]:
+    """Return a copy of a cached search result, or None if missing or expired."""
+    with _search_cache_lock:
+        entry = _search_cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > SEARCH_CACHE_TTL_SECONDS:
+            del _search_cache[cache_key]
+            return None
+        _search_cache.move_to_end(cache_key)
+    # Copy so callers can't mutate the cached object
+    return result.model_copy(deep=True)
+
+def _store_search_result(cache_key: str, result: SearchServiceResult) -> None:
+    """Store a successful search result, evicting the least recently used entries."""
+    with _search_cache_lock:
+        _search_cache[cache_key] = (time.monotonic(), result.model_copy(deep=True))
+        _search_cache.move_to_end(cache_key)
+        while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+
 async def execute_search_with_llm_retry(
     state: LearningPathState,
     initial_query: QueryObjectType,
@@ -39,6 +78,9 @@ async def execute_search_with_llm_retry(
     1. "No results found" errors (attempts regeneration first, then standard backoff).
     2. Any other search provider errors (e.g., 429, API errors - uses standard backoff).
     
+    Successful results are cached in memory for an hour, keyed by query, search language
+    and max_results. Set 'search_cache_enabled' to False in the state to bypass the cache.
+    
     Args:
         state: The current LearningPathState containing context and key providers.
         initial_query: The first SearchQuery or ResourceQuery object to try.
@@ -67,6 +109,10 @@ async def execute_search_with_llm_retry(
             query_str = getattr(initial_query, 'keywords', getattr(initial_query, 'query', 'unknown'))
             return SearchServiceResult(query=query_str, search_provider_error=f"No {provider_key_in_state} available")
     
+    max_results = search_config.get("max_results", 5)
+    search_language = state.get("search_language", "en")
+    use_cache = state.get("search_cache_enabled", True) is not False
+    
     current_query = initial_query
     result: Optional[SearchServiceResult] = None
     
@@ -90,12 +136,21 @@ async def execute_search_with_llm_retry(
             
         logger.info(f"Search attempt {attempt_number + 1}/{MAX_SEARCH_ATTEMPTS} with query: '{query_str}'")
         
+        # Serve repeated queries from the cache unless disabled for this run
+        cache_key = None
+        if use_cache:
+            cache_key = _search_cache_key(query_str, search_language, max_results)
+            cached_result = _get_cached_search_result(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached search results for query: '{query_str}'")
+                return cached_result
+        
         # Direct call to perform_search_and_scrape (rate limit handled within)
         try:
             result = await perform_search_and_scrape(
                 query=query_str,
                 brave_key_provider=search_provider_key_provider,
-                max_results=search_config.get("max_results", 5),
+                max_results=max_results,
                 scrape_timeout=search_config.get("scrape_timeout", 10)
             )
         except Exception as e:
@@ -113,6 +168,8 @@ async def execute_search_with_llm_retry(
         
         if not search_error:
             logger.info(f"Search successful on attempt {attempt_number + 1}/{MAX_SEARCH_ATTEMPTS}.")
+            if cache_key is not None and result.results:
+                _store_search_result(cache_key, result)
             return result # Success!
 
         # --- Handle Failure --- 
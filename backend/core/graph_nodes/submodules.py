@@ -23,9 +23,9 @@ from backend.models.models import (
     QuizQuestion,
     QuizQuestionList
 )
-from backend.parsers.parsers import submodule_parser, module_queries_parser, quiz_questions_parser, search_queries_parser # Added search_queries_parser
+from backend.parsers.parsers import submodule_parser, module_queries_parser, quiz_questions_parser, search_queries_parser, single_search_query_parser # Added search_queries_parser
 from backend.services.services import get_llm, perform_search_and_scrape, get_llm_with_search
-from backend.core.graph_nodes.helpers import run_chain, escape_curly_braces, batch_items, MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT # Import constant
+from backend.core.graph_nodes.helpers import run_chain, escape_curly_braces, batch_items, get_format_instructions, MAX_CHARS_PER_SCRAPED_RESULT_CONTEXT # Import constant
 from backend.core.graph_nodes.search_utils import execute_search_with_llm_retry
 
 # Import the extracted prompts
@@ -156,7 +156,7 @@ Your response MUST be a JSON object containing only the 'keywords' (the new sear
             "submodule_context": submodule_context,
             "output_language": output_language,
             "search_language": search_language,
-            "format_instructions": parser.get_format_instructions() # Use correct parser's instructions
+            "format_instructions": get_format_instructions(parser) # Use correct parser's instructions
         })
         
         # Check if the result is a valid SearchQuery object
@@ -369,7 +369,7 @@ async def plan_module_submodules(state: LearningPathState, idx: int, module) ->
             "module_description": module.description,
             "learning_path_context": learning_path_context,
             "language": output_language,
-            "format_instructions": submodule_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(submodule_parser)
         })
         submodules = result.submodules
         
@@ -1292,17 +1292,8 @@ Provide:
     
     prompt = ChatPromptTemplate.from_template(single_query_prompt)
     
-    from pydantic import BaseModel, Field
-    
-    class SingleSearchQueryOutput(BaseModel):
-        query: str = Field(description="The optimal search query to use")
-        rationale: str = Field(description="Explanation of why this query is optimal for this submodule")
-    
-    from langchain.output_parsers import PydanticOutputParser
-    single_query_parser = PydanticOutputParser(pydantic_object=SingleSearchQueryOutput)
-    
     try:
-        result = await run_chain(prompt, lambda: get_llm(key_provider=google_key_provider, user=state.get('user')), single_query_parser, {
+        result = await run_chain(prompt, lambda: get_llm(key_provider=google_key_provider, user=state.get('user')), single_search_query_parser, {
             "user_topic": user_topic,
             "module_title": module_title,
             "module_description": module_description,
@@ -1316,7 +1307,7 @@ Provide:
             "learning_path_context": learning_path_context,
             "output_language": output_language,
             "search_language": search_language,
-            "format_instructions": single_query_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(single_search_query_parser)
         })
         
         # Create a single high-quality SearchQuery
@@ -1688,7 +1679,7 @@ async def generate_submodule_quiz(
                 "submodule_description": submodule_description,
                 "submodule_content": escaped_content[:100000],  # Limit content length to avoid token limits
                 "language": output_language,
-                "format_instructions": quiz_questions_parser.get_format_instructions()
+                "format_instructions": get_format_instructions(quiz_questions_parser)
             })
             
             # Extract questions from result if parsing was successful
@@ -1710,7 +1701,7 @@ async def generate_submodule_quiz(
                     "submodule_description": submodule_description,
                     "submodule_content": escaped_content[:100000],
                     "language": output_language,
-                    "format_instructions": quiz_questions_parser.get_format_instructions()
+                    "format_instructions": get_format_instructions(quiz_questions_parser)
                 },
                 max_retries=3,
                 initial_retry_delay=1.0
@@ -2081,7 +2072,7 @@ async def generate_module_specific_planning_queries(state: LearningPathState, mo
             "learning_path_context": learning_path_context,
             "language": output_language,
             "search_language": search_language,
-            "format_instructions": search_queries_parser.get_format_instructions()
+            "format_instructions": get_format_instructions(search_queries_parser)
         })
         search_queries = result.queries
         logger.info(f"Generated {len(search_queries)} planning queries for module {module_id+1}")
@@ -2187,7 +2178,7 @@ Your response MUST be a JSON object containing only the 'keywords' (the new sear
             "module_context": module_context,
             "output_language": output_language,
             "search_language": search_language,
-            "format_instructions": parser.get_format_instructions(),
+            "format_instructions": get_format_instructions(parser),
         })
 
         if regenerated_query_object and isinstance(regenerated_query_object, SearchQuery):
@@ -2474,7 +2465,7 @@ async def plan_module_submodules(
         "learning_path_context": learning_path_context,
         "language": output_language,
         "planning_search_context": escape_curly_braces(planning_context_str),
-        "format_instructions": submodule_parser.get_format_instructions() # Ensure format instructions are passed
+        "format_instructions": get_format_instructions(submodule_parser) # Ensure format instructions are passed
     }
     
     # Insert the submodule count instruction if specified
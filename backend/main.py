@@ -3,6 +3,7 @@ import logging
 import os
 import json
 import uuid
+from datetime import datetime, timezone
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
@@ -19,6 +20,7 @@ from backend.core.graph_builder import build_graph
 from backend.models.models import LearningPathState
 from backend.config.log_config import setup_logging, log_debug_data, log_info_data, get_log_level
 from backend.services.key_provider import KeyProvider, GoogleKeyProvider, PerplexityKeyProvider, BraveKeyProvider
+from backend.services.services import close_scrape_session
 # Importa el decorador traceable de LangSmith
 from langsmith import traceable
 
@@ -72,6 +74,45 @@ async def shutdown_event():
     scheduler.shutdown()
     logger.info("APScheduler shut down.")
 
+def _start_progress_dispatcher(progress_callback: Callable):
+    """
+    Decouple graph nodes from the progress callback using a queue.
+    
+    Nodes keep calling ``await progress_callback(...)``, but the returned callback
+    only enqueues the update; a single background task delivers updates to the
+    original callback in order, so a slow consumer never stalls LLM or search work.
+    
+    Args:
+        progress_callback: The async callback that actually handles progress updates
+        
+    Returns:
+        A tuple of (queued_callback, close), where ``close`` flushes pending updates
+        and stops the dispatcher task.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def drain():
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            args, kwargs = item
+            try:
+                await progress_callback(*args, **kwargs)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {str(e)}")
+    
+    drainer = asyncio.create_task(drain())
+    
+    async def queued_callback(*args, **kwargs):
+        queue.put_nowait((args, kwargs))
+    
+    async def close():
+        queue.put_nowait(None)
+        await drainer
+    
+    return queued_callback, close
+
 # Define a function to run the graph
 async def run_graph(initial_state):
     """
@@ -124,7 +165,8 @@ async def generate_learning_path(
     desired_submodule_count: Optional[int] = None,
     language: str = "en",
     explanation_style: str = "standard",
-    user: Optional[Any] = None  # Add user parameter for model selection
+    user: Optional[Any] = None,  # Add user parameter for model selection
+    search_cache_enabled: bool = True
 ) -> Dict[str, Any]:
     """
     Asynchronous interface for course generation.
@@ -142,6 +184,7 @@ async def generate_learning_path(
         language: ISO language code for content generation (e.g., 'en', 'es')
         explanation_style: Style for content explanations (e.g., 'standard', 'simple')
         user: Optional user parameter for model selection
+        search_cache_enabled: Whether repeated web searches may be served from the in-memory cache
         
     Returns:
         Dictionary with the course data
@@ -175,6 +218,11 @@ async def generate_learning_path(
         search_language = "es"
         logger.info(f"Detected topic may have more resources in Spanish. Setting search language to Spanish.")
     
+    # Deliver progress updates from a background task instead of inline in the nodes
+    close_progress_dispatcher = None
+    if progress_callback:
+        progress_callback, close_progress_dispatcher = _start_progress_dispatcher(progress_callback)
+    
     # Initialize the state with the user topic and configuration
     initial_state = {
         "user_topic": topic,
@@ -191,10 +239,25 @@ async def generate_learning_path(
         "language": language,
         "search_language": search_language,
         "explanation_style": explanation_style,
+        "search_cache_enabled": search_cache_enabled,
+        # Stamped once so nodes don't each take their own timestamp
+        "run_started_at": datetime.now(timezone.utc).isoformat(),
     }
     
     # Configure and run the graph
-    return await run_graph(initial_state)
+    try:
+        return await run_graph(initial_state)
+    finally:
+        if close_progress_dispatcher:
+            # Make sure every queued update is delivered before returning
+            await close_progress_dispatcher()
+
+async def _generate_and_close_sessions(**kwargs) -> Dict[str, Any]:
+    """Run generate_learning_path, then close pooled HTTP sessions before the event loop ends."""
+    try:
+        return await generate_learning_path(**kwargs)
+    finally:
+        await close_scrape_session()
 
 def build_learning_path(
     topic: str,
@@ -207,7 +270,8 @@ def build_learning_path(
     desired_module_count: Optional[int] = None,
     desired_submodule_count: Optional[int] = None,
     language: str = "en",
-    explanation_style: str = "standard"
+    explanation_style: str = "standard",
+    search_cache_enabled: bool = True
 ) -> Dict[str, Any]:
     """
     Build a course for the given topic using a submodule-enhanced approach.
@@ -224,6 +288,7 @@ def build_learning_path(
         desired_submodule_count: Optional desired number of submodules per module
         language: ISO language code for content generation (e.g., 'en', 'es')
         explanation_style: Style for content explanations (e.g., 'standard', 'simple')
+        search_cache_enabled: Whether repeated web searches may be served from the in-memory cache
         
     Returns:
         Dictionary with the course data
@@ -237,7 +302,7 @@ def build_learning_path(
     brave_provider = BraveKeyProvider(brave_key_token)
     
     # Run async version
-    result = asyncio.run(generate_learning_path(
+    result = asyncio.run(_generate_and_close_sessions(
         topic=topic,
         parallel_count=parallel_count,
         search_parallel_count=search_parallel_count,
@@ -248,7 +313,8 @@ def build_learning_path(
         desired_module_count=desired_module_count,
         desired_submodule_count=desired_submodule_count,
         language=language,
-        explanation_style=explanation_style
+        explanation_style=explanation_style,
+        search_cache_enabled=search_cache_enabled
     ))
     return result
 
@@ -266,6 +332,7 @@ if __name__ == "__main__":
     parser.add_argument("--submodules", type=int, help="Desired number of submodules per module")
     parser.add_argument("--language", type=str, default="en", help="ISO language code for content generation (e.g., 'en', 'es')")
     parser.add_argument("--style", type=str, default="standard", help="Explanation style (standard, simple, technical, example, conceptual)")
+    parser.add_argument("--no-cache", action="store_true", help="Always run fresh web searches instead of reusing cached results")
     args = parser.parse_args()
     
     result = build_learning_path(
@@ -278,7 +345,8 @@ if __name__ == "__main__":
         desired_module_count=args.modules,
         desired_submodule_count=args.submodules,
         language=args.language,
-        explanation_style=args.style
+        explanation_style=args.style,
+        search_cache_enabled=not args.no_cache
     )
     
     # Print the course
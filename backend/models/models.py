@@ -24,6 +24,10 @@ class SearchQuery(BaseModel):
     keywords: str = Field(..., description="Search query keywords")
     rationale: str = Field(..., description="Rationale for the search query")
 
+class SingleSearchQueryOutput(BaseModel):
+    query: str = Field(description="The optimal search query to use")
+    rationale: str = Field(description="Explanation of why this query is optimal for this submodule")
+
 # Resource Model
 class Resource(BaseModel):
     title: str = Field(..., description="Title of the resource")
@@ -180,6 +184,8 @@ class LearningPathState(TypedDict):
     language: Optional[str]  # ISO language code for content generation
     explanation_style: Optional[str] # Style for content explanations
     search_language: Optional[str]  # ISO language code for search queries
+    search_cache_enabled: Optional[bool]  # Reuse cached web search results (default True)
+    run_started_at: Optional[str]  # ISO timestamp (UTC) taken once when the run starts
     # Other optional settings
     desired_module_count: Optional[int]
     desired_submodule_count: Optional[int]
@@ -8,7 +8,8 @@ from backend.models.models import (
     ModulePlanning, 
     QuizQuestionList,
     ResourceList,
-    ResourceQuery
+    ResourceQuery,
+    SingleSearchQueryOutput
 )
 
 search_queries_parser = PydanticOutputParser(pydantic_object=SearchQueryList)
@@ -21,3 +22,4 @@ enhanced_modules_parser = PydanticOutputParser(pydantic_object=EnhancedModuleLis
 quiz_questions_parser = PydanticOutputParser(pydantic_object=QuizQuestionList)
 resource_list_parser = PydanticOutputParser(pydantic_object=ResourceList)
 resource_query_parser = PydanticOutputParser(pydantic_object=ResourceQuery)
+single_search_query_parser = PydanticOutputParser(pydantic_object=SingleSearchQueryOutput)
@@ -84,6 +84,16 @@ FETCH_BUFFER = 3 # How many extra results to fetch beyond max_results
 _brave_search_lock = threading.Lock()
 _last_brave_call_time = 0.0
 
+# Shared aiohttp session for scraping so connections and DNS lookups are pooled
+# across searches instead of opening a new session per query. Every run and user
+# shares it, so there is no global connection cap (0 = unlimited, as with the old
+# per-query sessions); only connections to a single site are bounded.
+SCRAPE_MAX_CONNECTIONS = 0 # Total simultaneous scrape connections (0 = no limit)
+SCRAPE_MAX_CONNECTIONS_PER_HOST = 8 # Avoid hammering a single site
+SCRAPE_DNS_CACHE_TTL = 300 # Seconds
+_scrape_session: Optional[aiohttp.ClientSession] = None
+_scrape_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
 # --- Start of Modified PDF Helper Function ---
 def _extract_pdf_text_sync(pdf_bytes: bytes, source_url: str) -> str:
     """Synchronous helper to extract text from PDF bytes using PyMuPDF block analysis.
@@ -184,6 +194,78 @@ def _extract_pdf_text_sync(pdf_bytes: bytes, source_url: str) -> str:
 
 # --- End of Modified PDF Helper Function ---
 
+# --- Start of HTML Helper Function ---
+def _extract_html_text_sync(html_content: str, source_url: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Synchronous helper to extract cleaned text from an HTML document.
+
+    Uses Trafilatura first and falls back to BeautifulSoup when Trafilatura
+    yields too little content. Both are CPU-bound, so this is designed to be
+    run in a thread executor to keep the event loop free for other scrapes.
+
+    Args:
+        html_content: The raw HTML of the page.
+        source_url: The original URL for logging context.
+
+    Returns:
+        A tuple of (clean_text, error_message, extraction_method_used).
+    """
+    clean_text: Optional[str] = None
+    error_message: Optional[str] = None
+    extraction_method_used = "trafilatura" # Default assumption
+
+    # Attempt extraction with Trafilatura first
+    extracted_text = trafilatura.extract(
+        html_content,
+        include_comments=False, # Don't include comments
+        include_tables=True,    # Include table content if relevant
+        # favor_recall=True,    # Consider if more content is desired at risk of noise
+    )
+
+    # Check if Trafilatura result is usable
+    if extracted_text and len(extracted_text) >= TRAFILATURA_MIN_LENGTH_FALLBACK:
+        clean_text = extracted_text
+        logger.debug(f"Using Trafilatura extracted content for {source_url}")
+    else:
+        # Fallback to BeautifulSoup method if Trafilatura failed or got too little
+        extraction_method_used = "beautifulsoup_fallback"
+        logger.warning(f"Trafilatura yielded insufficient content (<{TRAFILATURA_MIN_LENGTH_FALLBACK} chars) for {source_url}. Falling back to BeautifulSoup.")
+        soup = BeautifulSoup(html_content, 'lxml') # Use lxml parser
+        # Remove common noise tags more aggressively
+        for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'header', 'form', 'button', 'input', 'textarea', 'select', 'option', 'label', 'iframe', 'noscript', 'figure', 'figcaption']):
+            tag.decompose()
+
+        # Find main content areas (add more selectors if needed)
+        main_content = soup.find('main') or \
+                       soup.find('article') or \
+                       soup.find('div', role='main') or \
+                       soup.find('div', id='content') or \
+                       soup.find('div', class_=re.compile(r'\b(content|main|body|article)\b', re.I)) # More flexible class search
+
+        target_element = main_content if main_content else soup.find('body')
+
+        if target_element:
+            clean_text = target_element.get_text(separator='\n', strip=True)
+        else:
+            # Extremely unlikely fallback
+            logger.error(f"Could not find body or main content element for HTML fallback: {source_url}")
+            clean_text = None # Mark as failure
+            error_message = "HTML parsing failed: No body/main element found"
+
+    # Apply final cleaning steps to text from either method
+    if clean_text:
+        # Corrected regex substitutions
+        clean_text = re.sub(r'[ \t]*\n[ \t]*', '\n', clean_text)
+        clean_text = re.sub(r'\n{3,}', '\n\n', clean_text).strip()
+        logger.info(f"Successfully extracted text from HTML ({extraction_method_used}): {source_url}")
+        error_message = None # Reset error on success
+    elif not error_message: # If clean_text became None/empty without an explicit error set
+         logger.warning(f"HTML processing ({extraction_method_used}) resulted in empty content for {source_url}")
+         error_message = "No text content extracted from HTML"
+
+    return clean_text, error_message, extraction_method_used
+
+# --- End of HTML Helper Function ---
+
 
 async def get_llm(key_provider=None, user=None):
     """
@@ -810,7 +892,10 @@ async def _scrape_single_url(session: aiohttp.ClientSession, url: str, timeout:
 
     try:
         logger.debug(f"Attempting to scrape URL: {url}")
-        async with session.get(url, timeout=timeout, headers=headers, ssl=False) as response:
+        # Bound connecting and each read instead of the total, so time spent waiting for a
+        # free connection to a busy host in the shared pool doesn't count as a timeout
+        request_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        async with session.get(url, timeout=request_timeout, headers=headers, ssl=False) as response:
             response.raise_for_status()
             content_type = response.headers.get("Content-Type", "").lower()
             
@@ -862,55 +947,11 @@ async def _scrape_single_url(session: aiohttp.ClientSession, url: str, timeout:
                 try:
                     html_content = await response.text()
 
-                    # Attempt extraction with Trafilatura first
-                    extracted_text = trafilatura.extract(
-                        html_content,
-                        include_comments=False, # Don't include comments
-                        include_tables=True,    # Include table content if relevant
-                        # favor_recall=True,    # Consider if more content is desired at risk of noise
+                    loop = asyncio.get_running_loop()
+                    clean_text, error_message, extraction_method_used = await loop.run_in_executor(
+                        None, _extract_html_text_sync, html_content, url
                     )
 
-                    # Check if Trafilatura result is usable
-                    if extracted_text and len(extracted_text) >= TRAFILATURA_MIN_LENGTH_FALLBACK:
-                        clean_text = extracted_text
-                        logger.debug(f"Using Trafilatura extracted content for {url}")
-                    else:
-                        # Fallback to BeautifulSoup method if Trafilatura failed or got too little
-                        extraction_method_used = "beautifulsoup_fallback"
-                        logger.warning(f"Trafilatura yielded insufficient content (<{TRAFILATURA_MIN_LENGTH_FALLBACK} chars) for {url}. Falling back to BeautifulSoup.")
-                        soup = BeautifulSoup(html_content, 'lxml') # Use lxml parser
-                        # Remove common noise tags more aggressively
-                        for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'header', 'form', 'button', 'input', 'textarea', 'select', 'option', 'label', 'iframe', 'noscript', 'figure', 'figcaption']):
-                            tag.decompose()
-
-                        # Find main content areas (add more selectors if needed)
-                        main_content = soup.find('main') or \
-                                       soup.find('article') or \
-                                       soup.find('div', role='main') or \
-                                       soup.find('div', id='content') or \
-                                       soup.find('div', class_=re.compile(r'\b(content|main|body|article)\b', re.I)) # More flexible class search
-
-                        target_element = main_content if main_content else soup.find('body')
-
-                        if target_element:
-                            clean_text = target_element.get_text(separator='\n', strip=True)
-                        else:
-                            # Extremely unlikely fallback
-                            logger.error(f"Could not find body or main content element for HTML fallback: {url}")
-                            clean_text = None # Mark as failure
-                            error_message = "HTML parsing failed: No body/main element found"
-
-                    # Apply final cleaning steps to text from either method
-                    if clean_text:
-                        # Corrected regex substitutions
-                        clean_text = re.sub(r'[ \t]*\n[ \t]*', '\n', clean_text)
-                        clean_text = re.sub(r'\n{3,}', '\n\n', clean_text).strip()
-                        logger.info(f"Successfully extracted text from HTML ({extraction_method_used}): {url}")
-                        error_message = None # Reset error on success
-                    elif not error_message: # If clean_text became None/empty without an explicit error set
-                         logger.warning(f"HTML processing ({extraction_method_used}) resulted in empty content for {url}")
-                         error_message = "No text content extracted from HTML"
-
                 except Exception as html_err:
                     logger.error(f"Error processing HTML content ({extraction_method_used}) for {url}: {type(html_err).__name__} - {html_err}", exc_info=True)
                     clean_text = None
@@ -951,6 +992,54 @@ async def _scrape_single_url(session: aiohttp.ClientSession, url: str, timeout:
 # --- End of Modified _scrape_single_url ---
 
 
+def _discard_scrape_session(session: aiohttp.ClientSession, session_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a scraping session left behind by another event loop, or log that it leaked.
+
+    Args:
+        session: The open session being replaced.
+        session_loop: The event loop the session was created on.
+    """
+    if session_loop is not None and session_loop.is_running() and not session_loop.is_closed():
+        # The owning loop is still alive (e.g. in another thread); close it there
+        asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+        logger.debug("Scheduled close of scraping session from a previous event loop")
+    else:
+        logger.warning("Replacing scraping session from a previous event loop that can no longer close it; its connections leak")
+
+def get_scrape_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session used for scraping, creating it if needed.
+
+    A session is bound to the event loop it was created on, so a new one is
+    created when called from a different loop (e.g. successive asyncio.run calls).
+    Cookies are not kept, so one scrape never affects later ones.
+
+    Returns:
+        The shared aiohttp.ClientSession for the running event loop.
+    """
+    global _scrape_session, _scrape_session_loop
+    loop = asyncio.get_running_loop()
+    if _scrape_session is None or _scrape_session.closed or _scrape_session_loop is not loop:
+        if _scrape_session is not None and not _scrape_session.closed:
+            _discard_scrape_session(_scrape_session, _scrape_session_loop)
+        connector = aiohttp.TCPConnector(
+            limit=SCRAPE_MAX_CONNECTIONS,
+            limit_per_host=SCRAPE_MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=SCRAPE_DNS_CACHE_TTL,
+        )
+        _scrape_session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+        _scrape_session_loop = loop
+        logger.debug("Created shared aiohttp session for scraping")
+    return _scrape_session
+
+async def close_scrape_session() -> None:
+    """Close the shared scraping session, if one is open. Call at application shutdown."""
+    global _scrape_session, _scrape_session_loop
+    if _scrape_session is not None and not _scrape_session.closed:
+        await _scrape_session.close()
+        logger.info("Closed shared aiohttp scraping session")
+    _scrape_session = None
+    _scrape_session_loop = None
+
 async def perform_search_and_scrape(
     query: str,
     brave_key_provider: 'BraveKeyProvider', # Renamed provider
@@ -1060,32 +1149,32 @@ async def perform_search_and_scrape(
         logger.debug(f"Prepared {len(urls_to_scrape)} unique URLs for scraping.")
         scraped_data_map = {}
 
-        async with aiohttp.ClientSession() as session:
-            for url in urls_to_scrape:
-                task = asyncio.create_task(
-                    _scrape_single_url(session, url, scrape_timeout),
-                    name=f"scrape_{url}"
-                )
-                scrape_tasks.append((url, task))
-
-            logger.debug(f"Gathering results for {len(scrape_tasks)} scraping tasks.")
-            scrape_results_tuples = await asyncio.gather(*(task for _, task in scrape_tasks), return_exceptions=True)
-            logger.debug(f"Completed gathering scrape results.")
-
-            for i, (url, _) in enumerate(scrape_tasks):
-                scrape_outcome = scrape_results_tuples[i]
-                if isinstance(scrape_outcome, Exception):
-                    if isinstance(scrape_outcome, asyncio.CancelledError):
-                        logger.warning(f"Scraping task for {url} was cancelled.")
-                        scraped_data_map[url] = (None, "Scraping task cancelled")
-                    else:
-                        logger.error(f"Gather caught exception for scrape task {url}: {scrape_outcome}", exc_info=isinstance(scrape_outcome, Exception))
-                        scraped_data_map[url] = (None, f"Gather error: {type(scrape_outcome).__name__}")
-                elif isinstance(scrape_outcome, tuple) and len(scrape_outcome) == 2:
-                    scraped_data_map[url] = scrape_outcome
+        session = get_scrape_session()
+        for url in urls_to_scrape:
+            task = asyncio.create_task(
+                _scrape_single_url(session, url, scrape_timeout),
+                name=f"scrape_{url}"
+            )
+            scrape_tasks.append((url, task))
+
+        logger.debug(f"Gathering results for {len(scrape_tasks)} scraping tasks.")
+        scrape_results_tuples = await asyncio.gather(*(task for _, task in scrape_tasks), return_exceptions=True)
+        logger.debug(f"Completed gathering scrape results.")
+
+        for i, (url, _) in enumerate(scrape_tasks):
+            scrape_outcome = scrape_results_tuples[i]
+            if isinstance(scrape_outcome, Exception):
+                if isinstance(scrape_outcome, asyncio.CancelledError):
+                    logger.warning(f"Scraping task for {url} was cancelled.")
+                    scraped_data_map[url] = (None, "Scraping task cancelled")
                 else:
-                    logger.error(f"Unexpected scrape outcome type for {url}: {type(scrape_outcome)} - {scrape_outcome}")
-                    scraped_data_map[url] = (None, f"Unexpected scrape result type: {type(scrape_outcome).__name__}")
+                    logger.error(f"Gather caught exception for scrape task {url}: {scrape_outcome}", exc_info=isinstance(scrape_outcome, Exception))
+                    scraped_data_map[url] = (None, f"Gather error: {type(scrape_outcome).__name__}")
+            elif isinstance(scrape_outcome, tuple) and len(scrape_outcome) == 2:
+                scraped_data_map[url] = scrape_outcome
+            else:
+                logger.error(f"Unexpected scrape outcome type for {url}: {type(scrape_outcome)} - {scrape_outcome}")
+                scraped_data_map[url] = (None, f"Unexpected scrape result type: {type(scrape_outcome).__name__}")
 
         # --- Start Prioritization Logic ---
         successful_scrapes = []
@@ -0,0 +1,110 @@
+"""
+Tests for the LLM retry helpers.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path to allow importing the application
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.core.graph_nodes.helpers import is_transient_error, get_retry_delay, MAX_RETRY_DELAY
+
+
+class StatusError(Exception):
+    """Exception carrying a structured HTTP status code."""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TestIsTransientError(unittest.TestCase):
+    """Test classification of retryable provider errors."""
+
+    def test_structured_status_codes(self):
+        """Test that 429 and 5xx status codes are transient and 4xx are not."""
+        self.assertTrue(is_transient_error(StatusError("Too many requests", 429)))
+        self.assertTrue(is_transient_error(StatusError("Internal error", 500)))
+        self.assertTrue(is_transient_error(StatusError("Bad gateway", 503)))
+        self.assertFalse(is_transient_error(StatusError("Invalid argument", 400)))
+        self.assertFalse(is_transient_error(StatusError("Permission denied", 403)))
+
+    def test_structured_status_code_wins_over_message(self):
+        """Test that a permanent status code is not retried because of its message text."""
+        self.assertFalse(is_transient_error(StatusError("Request timeout is too long", 400)))
+
+    def test_status_codes_in_message(self):
+        """Test that standalone status codes in the message are recognized."""
+        self.assertTrue(is_transient_error(Exception("429 Resource has been exhausted")))
+        self.assertTrue(is_transient_error(Exception("Server returned HTTP 502")))
+
+    def test_digits_inside_numbers_are_not_status_codes(self):
+        """Test that status-like digits inside larger numbers do not match."""
+        self.assertFalse(is_transient_error(Exception("max_output_tokens must be <= 8192, got 15000")))
+        self.assertFalse(is_transient_error(Exception("Input has 4290 tokens, limit is 1024")))
+
+    def test_transient_phrases(self):
+        """Test that rate limit and timeout phrases are recognized."""
+        self.assertTrue(is_transient_error(Exception("Rate limit exceeded")))
+        self.assertTrue(is_transient_error(Exception("The model is overloaded")))
+        self.assertTrue(is_transient_error(Exception("Request timed out")))
+
+    def test_timeouts_without_message(self):
+        """Test that timeout exceptions are transient even with an empty message."""
+        self.assertTrue(is_transient_error(asyncio.TimeoutError()))
+        self.assertTrue(is_transient_error(TimeoutError()))
+
+        class ReadTimeout(Exception):
+            """Stand-in for httpx.ReadTimeout, which often has no message."""
+
+        self.assertTrue(is_transient_error(ReadTimeout("")))
+
+    def test_permanent_errors(self):
+        """Test that ordinary errors are not retried."""
+        self.assertFalse(is_transient_error(ValueError("Invalid JSON in response")))
+        self.assertFalse(is_transient_error(Exception("API key not valid")))
+
+
+class TestGetRetryDelay(unittest.TestCase):
+    """Test backoff delay computation."""
+
+    def test_first_attempt_is_jittered(self):
+        """Test that the first retry delay is not a fixed value."""
+        delays = {get_retry_delay(None, 1, initial_delay=1.0) for _ in range(200)}
+        self.assertGreater(len(delays), 1)
+        self.assertTrue(all(0.0 <= delay <= 1.0 for delay in delays))
+
+    def test_full_jitter_range(self):
+        """Test that delays span from zero up to the exponential backoff."""
+        with patch("backend.core.graph_nodes.helpers.random.uniform", side_effect=lambda a, b: (a, b)):
+            self.assertEqual(get_retry_delay(None, 1, initial_delay=1.0), (0.0, 1.0))
+            self.assertEqual(get_retry_delay(None, 3, initial_delay=1.0), (0.0, 4.0))
+
+    def test_delay_is_capped(self):
+        """Test that the backoff never exceeds max_delay."""
+        delays = [get_retry_delay(None, 20, initial_delay=1.0) for _ in range(200)]
+        self.assertTrue(all(delay <= MAX_RETRY_DELAY for delay in delays))
+
+    def test_retry_after_header(self):
+        """Test that a Retry-After header is honored and capped."""
+        error = Exception("429 Too Many Requests")
+        error.response = Mock(headers={"Retry-After": "7"})
+        self.assertEqual(get_retry_delay(error, 1), 7.0)
+
+        error.response = Mock(headers={"Retry-After": "120"})
+        self.assertEqual(get_retry_delay(error, 1, max_delay=20.0), 20.0)
+
+    def test_invalid_retry_after_header(self):
+        """Test that an unparsable Retry-After header falls back to backoff."""
+        error = Exception("429 Too Many Requests")
+        error.response = Mock(headers={"Retry-After": "soon"})
+        delay = get_retry_delay(error, 2, initial_delay=1.0)
+        self.assertTrue(0.0 <= delay <= 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
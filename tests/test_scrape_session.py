@@ -0,0 +1,106 @@
+"""
+Tests for the shared aiohttp scraping session.
+"""
+
+import unittest
+import asyncio
+import threading
+import sys
+import os
+
+import aiohttp
+
+# Add parent directory to path to allow importing the application
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.services import services
+from backend.services.services import get_scrape_session, close_scrape_session
+
+
+class TestScrapeSession(unittest.TestCase):
+    """Test pooling and event loop handling of the shared scraping session."""
+
+    def setUp(self):
+        services._scrape_session = None
+        services._scrape_session_loop = None
+
+    def tearDown(self):
+        services._scrape_session = None
+        services._scrape_session_loop = None
+
+    def test_session_is_shared_within_a_loop(self):
+        """Test that all scrapes on one loop share one pooled, cookie-less session."""
+        async def get_twice():
+            first = get_scrape_session()
+            second = get_scrape_session()
+            details = (first is second, first.cookie_jar, first.connector.limit, first.connector.limit_per_host)
+            await close_scrape_session()
+            return details
+
+        same, cookie_jar, limit, limit_per_host = asyncio.run(get_twice())
+        self.assertTrue(same)
+        self.assertIsInstance(cookie_jar, aiohttp.DummyCookieJar)
+        self.assertEqual(limit, services.SCRAPE_MAX_CONNECTIONS)
+        self.assertEqual(limit_per_host, services.SCRAPE_MAX_CONNECTIONS_PER_HOST)
+
+    def test_close_resets_session(self):
+        """Test that close_scrape_session closes the session and a new one is created afterwards."""
+        async def close_and_reopen():
+            first = get_scrape_session()
+            await close_scrape_session()
+            second = get_scrape_session()
+            await close_scrape_session()
+            return first, second
+
+        first, second = asyncio.run(close_and_reopen())
+        self.assertTrue(first.closed)
+        self.assertIsNot(first, second)
+
+    def test_session_from_finished_loop_is_replaced(self):
+        """Test that a new loop gets a new session and the unclosable old one is logged."""
+        async def get_session():
+            return get_scrape_session()
+
+        first = asyncio.run(get_session())
+
+        async def get_new_session():
+            session = get_scrape_session()
+            await close_scrape_session()
+            return session
+
+        with self.assertLogs(services.logger, level="WARNING") as logs:
+            second = asyncio.run(get_new_session())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(any("previous event loop" in message for message in logs.output))
+
+    def test_session_from_running_loop_is_closed_on_that_loop(self):
+        """Test that a session whose loop still runs in another thread is closed there."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            async def get_session():
+                return get_scrape_session()
+
+            first = asyncio.run_coroutine_threadsafe(get_session(), other_loop).result(timeout=5)
+
+            async def get_new_session():
+                session = get_scrape_session()
+                await close_scrape_session()
+                return session
+
+            second = asyncio.run(get_new_session())
+
+            # The close was scheduled on the owning loop; wait for it to run there
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop).result(timeout=5)
+            self.assertIsNot(first, second)
+            self.assertTrue(first.closed)
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
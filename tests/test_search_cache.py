@@ -0,0 +1,121 @@
+"""
+Tests for the in-memory search result cache.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+import sys
+import os
+
+# Add parent directory to path to allow importing the application
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.models import SearchQuery, SearchServiceResult, ScrapedResult
+from backend.core.graph_nodes import search_utils
+from backend.core.graph_nodes.search_utils import execute_search_with_llm_retry
+
+
+def make_result(query, error=None, with_results=True):
+    """Build a SearchServiceResult with a single scraped page."""
+    results = []
+    if with_results:
+        results.append(ScrapedResult(url="https://example.com", title="Example", scraped_content="Some content"))
+    return SearchServiceResult(query=query, results=results, search_provider_error=error)
+
+
+class TestSearchCache(unittest.TestCase):
+    """Test caching of web search results in execute_search_with_llm_retry."""
+
+    def setUp(self):
+        search_utils._search_cache.clear()
+        self.state = {"user_topic": "Python", "search_language": "en", "brave_key_provider": Mock()}
+        self.query = SearchQuery(keywords="python basics", rationale="test")
+        self.regenerate = AsyncMock(return_value=None)
+
+    def tearDown(self):
+        search_utils._search_cache.clear()
+
+    def run_search(self, state=None):
+        return asyncio.run(execute_search_with_llm_retry(
+            state=state or self.state,
+            initial_query=self.query,
+            regenerate_query_func=self.regenerate,
+            search_config={"max_results": 5, "scrape_timeout": 10},
+        ))
+
+    def test_repeated_query_served_from_cache(self):
+        """Test that a second identical query does not search again."""
+        search_mock = AsyncMock(return_value=make_result("python basics"))
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            first = self.run_search()
+            second = self.run_search()
+
+        self.assertEqual(search_mock.await_count, 1)
+        self.assertEqual(first, second)
+        # Callers get copies, so mutating one must not affect the cache
+        second.results.clear()
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            third = self.run_search()
+        self.assertEqual(len(third.results), 1)
+
+    def test_cache_disabled_bypasses_cache(self):
+        """Test that search_cache_enabled=False always searches."""
+        state = dict(self.state, search_cache_enabled=False)
+        search_mock = AsyncMock(return_value=make_result("python basics"))
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            self.run_search(state)
+            self.run_search(state)
+
+        self.assertEqual(search_mock.await_count, 2)
+        self.assertEqual(len(search_utils._search_cache), 0)
+
+    def test_errors_are_not_cached(self):
+        """Test that failed searches are not stored."""
+        search_mock = AsyncMock(return_value=make_result("python basics", error="HTTP error 500", with_results=False))
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock), \
+             patch.object(search_utils.asyncio, "sleep", AsyncMock()):
+            result = self.run_search()
+
+        self.assertEqual(result.search_provider_error, "HTTP error 500")
+        self.assertEqual(len(search_utils._search_cache), 0)
+
+    def test_empty_results_are_not_cached(self):
+        """Test that successful searches without results are not stored."""
+        search_mock = AsyncMock(return_value=make_result("python basics", with_results=False))
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            self.run_search()
+            self.run_search()
+
+        self.assertEqual(search_mock.await_count, 2)
+        self.assertEqual(len(search_utils._search_cache), 0)
+
+    def test_expired_entries_are_evicted(self):
+        """Test that entries older than the TTL are dropped and searched again."""
+        search_mock = AsyncMock(return_value=make_result("python basics"))
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            self.run_search()
+
+        # Age the stored entry past the TTL
+        cache_key = next(iter(search_utils._search_cache))
+        stored_at, cached = search_utils._search_cache[cache_key]
+        search_utils._search_cache[cache_key] = (stored_at - search_utils.SEARCH_CACHE_TTL_SECONDS - 1, cached)
+
+        self.assertIsNone(search_utils._get_cached_search_result(cache_key))
+        self.assertNotIn(cache_key, search_utils._search_cache)
+
+        with patch.object(search_utils, "perform_search_and_scrape", search_mock):
+            self.run_search()
+        self.assertEqual(search_mock.await_count, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows beyond its maximum size."""
+        with patch.object(search_utils, "SEARCH_CACHE_MAX_ENTRIES", 2):
+            for key in ("a", "b", "c"):
+                search_utils._store_search_result(key, make_result(key))
+
+        self.assertEqual(list(search_utils._search_cache), ["b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
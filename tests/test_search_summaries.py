@@ -0,0 +1,149 @@
+"""
+Tests for the map step that summarizes search results before course synthesis.
+"""
+
+import unittest
+import asyncio
+import re
+from unittest.mock import AsyncMock, Mock, patch
+import sys
+import os
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+# Add parent directory to path to allow importing the application
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.models import SearchServiceResult, ScrapedResult
+from backend.core.graph_nodes import initial_flow
+from backend.core.graph_nodes.initial_flow import summarize_search_results, create_learning_path, SUMMARY_MIN_CHARS
+
+
+def long_context(label):
+    """Build a context long enough to be summarized."""
+    return f"Sources for {label}. " + "x" * SUMMARY_MIN_CHARS
+
+
+def query_from_prompt(prompt_value):
+    """Extract the search query from a rendered summary prompt."""
+    return re.search(r"SEARCH QUERY: (.*)", prompt_value.to_string()).group(1).strip()
+
+
+def fake_llm(handler):
+    """Wrap an async handler(query) as a runnable LLM returning an AIMessage."""
+    async def invoke(prompt_value):
+        return AIMessage(content=await handler(query_from_prompt(prompt_value)))
+
+    def invoke_sync(prompt_value):
+        raise NotImplementedError("Summaries are generated asynchronously")
+
+    return RunnableLambda(invoke_sync, afunc=invoke)
+
+
+class TestSummarizeSearchResults(unittest.TestCase):
+    """Test summarize_search_results."""
+
+    def setUp(self):
+        self.state = {"user_topic": "Python", "language": "en"}
+
+    def run_summaries(self, report_contexts, llm):
+        with patch.object(initial_flow, "get_llm", AsyncMock(return_value=llm)) as get_llm:
+            contexts = asyncio.run(summarize_search_results(self.state, report_contexts))
+        return contexts, get_llm
+
+    def test_short_contexts_pass_through(self):
+        """Test that short contexts are returned unchanged without calling the LLM."""
+        report_contexts = [("q1", "short one"), ("q2", "short two")]
+        handler = AsyncMock(return_value="summary")
+
+        contexts, get_llm = self.run_summaries(report_contexts, fake_llm(handler))
+
+        self.assertEqual(contexts, ["short one", "short two"])
+        get_llm.assert_not_awaited()
+        handler.assert_not_awaited()
+
+    def test_failed_summary_falls_back_to_raw_context(self):
+        """Test that a non-transient failure keeps the raw context and is not retried."""
+        report_contexts = [("q1", long_context("q1")), ("q2", long_context("q2"))]
+
+        async def handler(query):
+            if query == "q1":
+                raise ValueError("400 Invalid argument")
+            return f"summary of {query}"
+
+        calls = []
+
+        async def counting_handler(query):
+            calls.append(query)
+            return await handler(query)
+
+        with self.assertLogs(level="INFO") as logs:
+            contexts, _ = self.run_summaries(report_contexts, fake_llm(counting_handler))
+
+        self.assertEqual(contexts, [long_context("q1"), "summary of q2"])
+        self.assertEqual(calls.count("q1"), 1)
+        self.assertTrue(any("Used raw content for 1 of 2" in message for message in logs.output))
+
+    def test_transient_error_is_retried(self):
+        """Test that a rate-limited summary is retried before falling back."""
+        report_contexts = [("q1", long_context("q1"))]
+        attempts = []
+
+        async def handler(query):
+            attempts.append(query)
+            if len(attempts) == 1:
+                raise Exception("429 Resource has been exhausted")
+            return "summary after retry"
+
+        with patch.object(initial_flow.asyncio, "sleep", AsyncMock()):
+            contexts, _ = self.run_summaries(report_contexts, fake_llm(handler))
+
+        self.assertEqual(contexts, ["summary after retry"])
+        self.assertEqual(len(attempts), 2)
+
+    def test_order_is_kept_across_gather(self):
+        """Test that summaries keep the query order even when they finish out of order."""
+        report_contexts = [
+            ("q1", long_context("q1")),
+            ("q2", "short two"),
+            ("q3", long_context("q3")),
+            ("q4", long_context("q4")),
+        ]
+        delays = {"q1": 0.05, "q3": 0.0, "q4": 0.02}
+
+        async def handler(query):
+            await asyncio.sleep(delays[query])
+            return f"summary of {query}"
+
+        contexts, _ = self.run_summaries(report_contexts, fake_llm(handler))
+
+        self.assertEqual(contexts, ["summary of q1", "short two", "summary of q3", "summary of q4"])
+
+
+class TestCreateLearningPathSummaries(unittest.TestCase):
+    """Test how create_learning_path feeds search results to the map step."""
+
+    def test_duplicate_reports_are_summarized_once(self):
+        """Test that a result shared by duplicate queries is included only once."""
+        shared = SearchServiceResult(
+            query="python basics",
+            results=[ScrapedResult(url="https://example.com", title="Example", scraped_content="Some content")],
+        )
+        other = SearchServiceResult(
+            query="python advanced",
+            results=[ScrapedResult(url="https://example.org", title="Other", scraped_content="More content")],
+        )
+        state = {"user_topic": "Python", "language": "en", "search_results": [shared, other, shared]}
+
+        summarize_mock = AsyncMock(side_effect=lambda state, report_contexts: [text for _, text in report_contexts])
+        with patch.object(initial_flow, "summarize_search_results", summarize_mock), \
+             patch.object(initial_flow, "run_chain", AsyncMock(return_value=Mock(modules=[]))):
+            asyncio.run(create_learning_path(state))
+
+        report_contexts = summarize_mock.await_args.args[1]
+        self.assertEqual([query for query, _ in report_contexts], ["python basics", "python advanced"])
+
+
+if __name__ == "__main__":
+    unittest.main()